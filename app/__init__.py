@@ -1,7 +1,72 @@
+import orjson
 from flask import Flask, render_template
+from flask.json.provider import DefaultJSONProvider
+from flask_babel import Babel
+from flask_cors import CORS
+from flask_sqlalchemy import SQLAlchemy
+from vitalsync import vitalsync_bp
+
+from .routes import bp as api_bp
+
+# extensions are created unbound and attached to the app in create_app
+db = SQLAlchemy()
+cors = CORS()
+babel = Babel()
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask's default JSON provider with orjson doing the encoding.
+
+    Types orjson cannot encode itself (Decimal, dates, ``__html__``) go
+    through :attr:`default` as before, and non-str dict keys are converted
+    to strings like the stdlib encoder does. Differences from the stdlib
+    encoder:
+
+    -   Output is UTF-8 rather than ASCII-escaped.
+    -   NaN and infinite floats encode as ``null`` instead of ``NaN``.
+
+    Calls with keyword arguments orjson has no equivalent for, and values
+    orjson refuses (such as integers wider than 64 bits), are passed
+    unchanged to the stdlib encoder.
+    """
+
+    ensure_ascii = False
+
+    # dumps kwargs that orjson reproduces exactly; anything else falls back
+    _ORJSON_KWARGS = {"indent": 2, "separators": (",", ":")}
+
+    def dumps(self, obj, **kwargs):
+        if any(self._ORJSON_KWARGS.get(key, object()) != value for key, value in kwargs.items()):
+            return super().dumps(obj, **kwargs)
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if "indent" in kwargs:
+            option |= orjson.OPT_INDENT_2
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        try:
+            return orjson.dumps(obj, default=self.default, option=option).decode()
+        except orjson.JSONEncodeError:
+            return super().dumps(obj, **kwargs)
+
+    def loads(self, s, **kwargs):
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
 
 def create_app():
     app = Flask(__name__)
+    app.json = OrjsonProvider(app)
+    app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite:///vitanet.db"
+    app.config["BABEL_DEFAULT_LOCALE"] = "en"
+
+    db.init_app(app)
+    cors.init_app(app)
+    babel.init_app(app)
+
+    # register blueprints
+    app.register_blueprint(api_bp)
+    app.register_blueprint(vitalsync_bp)
 
     @app.route("/")
     def index():
@@ -1,5 +1,6 @@
 import requests
 import datetime
+from concurrent.futures import ThreadPoolExecutor
 
 routes = {
     "VitalsSync": "http://localhost:5000/vitalsync",
@@ -10,13 +11,16 @@ routes = {
 log_file = "route_status.log"
 with open(log_file, "w") as log:
     log.write(f"🔎 Route Health Check — {datetime.datetime.now()}\n\n")
-    for name, url in routes.items():
-        try:
-            response = requests.get(url, timeout=3)
-            if response.status_code == 200:
-                log.write(f"✅ {name} — {url} — Status {response.status_code}\n")
-            else:
-                log.write(f"⚠️ {name} — {url} — Unexpected Status: {response.status_code}\n")
-        except Exception as e:
-            log.write(f"❌ {name} — {url} — Error: {e}\n")
-
+    # check all routes at once over one pooled session; results are still
+    # written in the order the routes are declared
+    with requests.Session() as session, ThreadPoolExecutor(max_workers=len(routes)) as executor:
+        futures = {name: executor.submit(session.get, url, timeout=3) for name, url in routes.items()}
+        for name, url in routes.items():
+            try:
+                response = futures[name].result()
+                if response.status_code == 200:
+                    log.write(f"✅ {name} — {url} — Status {response.status_code}\n")
+                else:
+                    log.write(f"⚠️ {name} — {url} — Unexpected Status: {response.status_code}\n")
+            except Exception as e:
+                log.write(f"❌ {name} — {url} — Error: {e}\n")
@@ -1,11 +1,18 @@
 #!/usr/bin/env python3
 
 import os
+import re
+import argparse
 import subprocess
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
-# Setup logging
-logging.basicConfig(filename='repair_log.txt', level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+FSCK_TARGET = '/dev/sda1'  # Example for /dev/sda1
+MOUNTS_FILE = '/proc/mounts'
+
+def configure_logging():
+    """Log to repair_log.txt."""
+    logging.basicConfig(filename='repair_log.txt', level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
 def setup():
     """Initial setup and configuration management."""
@@ -21,15 +28,24 @@ def repair_strategy_one():
     """First repair strategy: Filesystem check."""
     logging.info("Executing repair strategy one: Filesystem check...")
     try:
-        subprocess.run(['fsck', '-y', '/dev/sda1'], check=True)  # Example for /dev/sda1
+        subprocess.run(['fsck', '-y', FSCK_TARGET], check=True)
     except subprocess.CalledProcessError as e:
         logging.error(f"Error during filesystem check: {e}")
 
-def repair_strategy_two():
-    """Second repair strategy: Package reinstallation."""
+def repair_strategy_two(interactive=True):
+    """Second repair strategy: Package reinstallation.
+
+    With interactive=False apt-get answers its own prompts and is detached
+    from stdin, so it can run alongside another command on the terminal.
+    """
     logging.info("Executing repair strategy two: Package reinstallation...")
+    command = ['apt-get', 'install', '--reinstall', 'ubuntu-desktop']
+    stdin = None
+    if not interactive:
+        command.insert(2, '-y')
+        stdin = subprocess.DEVNULL
     try:
-        subprocess.run(['apt-get', 'install', '--reinstall', 'ubuntu-desktop'], check=True)
+        subprocess.run(command, check=True, stdin=stdin)
     except subprocess.CalledProcessError as e:
         logging.error(f"Error during package reinstallation: {e}")
 
@@ -38,14 +54,81 @@ def generate_report():
     logging.info("Generating repair report...")
     # Report generation logic
 
-def main():
+def _unescape_mount_field(field):
+    """Undo the octal escapes (e.g. \\040 for a space) used in /proc/mounts."""
+    return re.sub(r'\\([0-7]{3})', lambda m: chr(int(m.group(1), 8)), field)
+
+def is_mounted(device):
+    """Return True if device is mounted, or if that cannot be determined.
+
+    Mounts are matched by device number, so aliases such as /dev/root,
+    /dev/disk/by-uuid/... links and device-mapper names are caught, and by
+    resolved source path for filesystems (like btrfs) whose mount point
+    reports an anonymous device number.
+    """
+    try:
+        rdev = os.stat(device).st_rdev
+        target = os.path.realpath(device)
+        with open(MOUNTS_FILE) as mounts:
+            for line in mounts:
+                fields = line.split()
+                if len(fields) < 2:
+                    continue
+                source = _unescape_mount_field(fields[0])
+                mountpoint = _unescape_mount_field(fields[1])
+                if source.startswith('/') and os.path.realpath(source) == target:
+                    return True
+                try:
+                    if rdev and os.stat(mountpoint).st_dev == rdev:
+                        return True
+                except OSError:
+                    continue
+    except OSError:
+        return True
+    return False
+
+def run_repairs(concurrent=False):
+    """Run the repair strategies, one after another unless concurrent is set.
+
+    The filesystem check is only overlapped with the package reinstall when
+    its target is not mounted; fsck -y on a filesystem apt is writing to can
+    corrupt it, so in that case the strategies run serially regardless.
+    """
+    if concurrent and is_mounted(FSCK_TARGET):
+        logging.warning(f"{FSCK_TARGET} is mounted; running repair strategies serially")
+        concurrent = False
+    if not concurrent:
+        repair_strategy_one()
+        repair_strategy_two()
+        return
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [
+            executor.submit(repair_strategy_one),
+            executor.submit(repair_strategy_two, interactive=False),
+        ]
+        for future in futures:
+            future.result()
+
+def main(concurrent=False):
     """Main function to orchestrate the repair process."""
     setup()
     analyze_system()
-    repair_strategy_one()
-    repair_strategy_two()
+    run_repairs(concurrent=concurrent)
     generate_report()
     logging.info("Repair process completed.")
 
+def parse_args(argv=None):
+    """Parse command-line options."""
+    parser = argparse.ArgumentParser(description="Repair an Ubuntu installation.")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--serial", dest="concurrent", action="store_false",
+                      help="run repair strategies one after another (default)")
+    mode.add_argument("--concurrent", dest="concurrent", action="store_true",
+                      help="overlap the repair strategies when the fsck target is not mounted")
+    parser.set_defaults(concurrent=False)
+    return parser.parse_args(argv)
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    configure_logging()
+    args = parse_args()
+    main(concurrent=args.concurrent)
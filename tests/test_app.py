@@ -0,0 +1,81 @@
+import json
+from decimal import Decimal
+
+import pytest
+
+from app import create_app
+
+
+@pytest.fixture
+def app():
+    app = create_app()
+    app.config["TESTING"] = True
+    return app
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+def test_vitalsync_is_served_as_json(client):
+    response = client.get("/vitalsync")
+    assert response.status_code == 200
+    assert response.content_type == "application/json"
+    assert response.get_json() == {"message": "Welcome to VitalsSync Module!"}
+
+
+def test_json_provider_handles_decimal_and_non_str_keys(app):
+    with app.app_context():
+        response = app.json.response({"price": Decimal("1.50"), 2: "two", "a": 1})
+    assert response.get_data() == b'{"2":"two","a":1,"price":"1.50"}\n'
+
+
+def test_api_data_sends_etag_and_cache_headers(client):
+    response = client.get("/api/data")
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+    assert etag.startswith('"') and etag.endswith('"')
+    assert response.headers["Cache-Control"] == "public, max-age=3600"
+
+
+def test_api_data_matching_etag_returns_304(client):
+    etag = client.get("/api/data").headers["ETag"]
+    response = client.get("/api/data", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.get_data() == b""
+
+
+def test_api_data_stale_etag_returns_200(client):
+    response = client.get("/api/data", headers={"If-None-Match": '"stale"'})
+    assert response.status_code == 200
+    assert response.get_data()
+
+
+def test_api_data_body_matches_jsonify_output(client):
+    response = client.get("/api/data")
+    assert response.content_type == "application/json"
+    assert response.get_data() == (
+        b'[{"calories":95,"carbs_g":25,"item":"Apple"},'
+        b'{"calories":105,"carbs_g":27,"item":"Banana"},'
+        b'{"calories":25,"carbs_g":6,"item":"Carrot"}]\n'
+    )
+
+
+def test_json_provider_indents_in_debug_mode(app):
+    app.debug = True
+    with app.app_context():
+        response = app.json.response({"b": 1, "a": [1]})
+    assert response.get_data() == b'{\n  "a": [\n    1\n  ],\n  "b": 1\n}\n'
+
+
+def test_json_provider_passes_unsupported_kwargs_to_stdlib(app):
+    obj = {"b": [1, 2], "a": 1}
+    assert app.json.dumps(obj, indent=2, sort_keys=False) == json.dumps(obj, indent=2)
+    assert app.json.dumps(obj, indent=2, separators=(", ", ": ")) == json.dumps(
+        obj, indent=2, separators=(", ", ": "), sort_keys=True
+    )
+
+
+def test_json_provider_encodes_wide_ints_via_stdlib(app):
+    assert app.json.dumps({"n": 2 ** 70}, separators=(",", ":")) == '{"n":1180591620717411303424}'
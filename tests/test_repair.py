@@ -0,0 +1,96 @@
+import os
+import subprocess
+from types import SimpleNamespace
+
+import pytest
+
+import repair_ubuntu_universe_v30_final as repair
+
+
+@pytest.fixture
+def commands(monkeypatch):
+    calls = []
+
+    def fake_run(command, **kwargs):
+        calls.append((command, kwargs.get('stdin')))
+        return subprocess.CompletedProcess(command, 0)
+
+    monkeypatch.setattr(repair.subprocess, 'run', fake_run)
+    return calls
+
+
+def test_serial_is_the_default():
+    assert repair.parse_args([]).concurrent is False
+
+
+def test_serial_keeps_the_old_order(commands):
+    repair.main(concurrent=repair.parse_args(['--serial']).concurrent)
+    assert commands == [
+        (['fsck', '-y', repair.FSCK_TARGET], None),
+        (['apt-get', 'install', '--reinstall', 'ubuntu-desktop'], None),
+    ]
+
+
+def test_concurrent_runs_both_and_apt_non_interactively(commands, monkeypatch):
+    monkeypatch.setattr(repair, 'is_mounted', lambda device: False)
+    repair.main(concurrent=repair.parse_args(['--concurrent']).concurrent)
+    assert sorted(commands) == [
+        (['apt-get', 'install', '-y', '--reinstall', 'ubuntu-desktop'], subprocess.DEVNULL),
+        (['fsck', '-y', repair.FSCK_TARGET], None),
+    ]
+
+
+def test_concurrent_falls_back_to_serial_when_target_is_mounted(commands, monkeypatch):
+    monkeypatch.setattr(repair, 'is_mounted', lambda device: True)
+    repair.run_repairs(concurrent=True)
+    assert [command[0] for command, _ in commands] == ['fsck', 'apt-get']
+
+
+@pytest.fixture
+def mounts(tmp_path, monkeypatch):
+    mounts_file = tmp_path / 'mounts'
+    monkeypatch.setattr(repair, 'MOUNTS_FILE', str(mounts_file))
+    return mounts_file
+
+
+@pytest.fixture
+def fake_stat(monkeypatch):
+    """Serve stat results for fake paths, falling back to the real os.stat."""
+    results = {}
+    real_stat = os.stat
+
+    def stat(path, *args, **kwargs):
+        if path in results:
+            return results[path]
+        return real_stat(path, *args, **kwargs)
+
+    monkeypatch.setattr(repair.os, 'stat', stat)
+    return results
+
+
+def test_is_mounted_matches_an_aliased_device_by_number(mounts, fake_stat):
+    mounts.write_text('/dev/root / ext4 rw,relatime 0 0\n')
+    fake_stat['/dev/sda1'] = SimpleNamespace(st_rdev=0x801)
+    fake_stat['/'] = SimpleNamespace(st_dev=0x801)
+    assert repair.is_mounted('/dev/sda1')
+
+
+def test_is_mounted_matches_a_symlinked_source(mounts, tmp_path):
+    device = tmp_path / 'sda1'
+    device.touch()
+    alias = tmp_path / 'by-uuid-1234'
+    alias.symlink_to(device)
+    mounts.write_text(f'{alias} /nonexistent btrfs rw 0 0\n')
+    assert repair.is_mounted(str(device))
+
+
+def test_is_mounted_ignores_other_devices(mounts, fake_stat):
+    mounts.write_text('/dev/sdb1 /data ext4 rw 0 0\n')
+    fake_stat['/dev/sda1'] = SimpleNamespace(st_rdev=0x801)
+    fake_stat['/data'] = SimpleNamespace(st_dev=0x811)
+    assert not repair.is_mounted('/dev/sda1')
+
+
+def test_is_mounted_treats_an_unknown_device_as_mounted(mounts):
+    mounts.write_text('')
+    assert repair.is_mounted(str(mounts.parent / 'missing'))